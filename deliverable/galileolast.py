@@ -1,7 +1,43 @@
+import os
+
 import numpy as np
-import matplotlib.pyplot as plt
+import matplotlib
 from scipy.integrate import odeint
 
+# The deliverable is shipped on its own, so its helpers are defined here
+# rather than imported from the repository root.
+
+# Set HEADLESS=1 (or true/yes) for batch runs: figures are then saved as
+# figure_<name>.png with the non-interactive Agg backend instead of shown.
+HEADLESS = os.environ.get("HEADLESS", "").strip().lower() not in ("", "0", "false", "no")
+if HEADLESS:
+    matplotlib.use("Agg")  # must happen before pyplot is imported
+import matplotlib.pyplot as plt
+
+def show_figure(name, block=True):
+    """Show the current figure, or in headless runs save it as figure_<name>.png and close it."""
+    if HEADLESS:
+        plt.savefig(f"figure_{name}.png", dpi=100)
+        plt.close()
+    else:
+        plt.show(block=block)
+
+def solve_kepler(M, e):
+    """
+    Solve Kepler's equation E - e sin(E) = M elementwise with Newton-Raphson.
+    Returns (sin E, cos E), reusing the last step's sine and cosine
+    corrected to first order in its tiny dE.
+    """
+    E = M + e * np.sin(M)
+    for _ in range(10):
+        sinE = np.sin(E)
+        cosE = np.cos(E)
+        dE = (E - e * sinE - M) / (1 - e * cosE)
+        E -= dE
+        if np.max(np.abs(dE)) < 1e-13:
+            break
+    return sinE - dE * cosE, cosE + dE * sinE
+
 class GalileoRedshiftSimulation:
     """
     Simulates the gravitational redshift effect for Galileo satellites in both
@@ -10,9 +46,13 @@ class GalileoRedshiftSimulation:
     
     def __init__(self):
         # Constants
-        self.G = 6.67430e-11  # Gravitational constant (m^3 kg^-1 s^-1)
-        self.M = 5.972e24     # Earth's mass (kg)
-        self.c = 299792458    # Speed of light (m/s)
+        self.G = 6.67430e-11   # Gravitational constant (m^3 kg^-1 s^-2)
+        self.M = 5.9722e24     # Earth's mass (kg)
+        self.c = 299792458.0   # Speed of light (m/s)
+        
+        # Derived constants, computed once instead of on every call
+        self._GM = self.G * self.M
+        self._inv_c2 = 1.0 / self.c**2
         
         # Galileo satellite orbital parameters (GSAT0201)
         # Elliptical orbit (actual)
@@ -25,32 +65,28 @@ class GalileoRedshiftSimulation:
         self.period_circular = 12 * 3600  # Intended orbital period (s)
     
     def orbital_position_elliptical(self, t):
-        """Calculate satellite position in elliptical orbit at time t."""
+        """Calculate satellite position in elliptical orbit at time(s) t (scalar or array)."""
+        e = self.eccentricity_elliptical
         n = 2 * np.pi / self.period_elliptical
-        M = n * t
-        
-        # Solve Kepler's equation iteratively
-        E = M
-        for _ in range(10):
-            E = M + self.eccentricity_elliptical * np.sin(E)
+        M = n * np.asarray(t, dtype=float)
         
-        v = 2 * np.arctan(np.sqrt((1 + self.eccentricity_elliptical)/(1 - self.eccentricity_elliptical)) * np.tan(E/2))
-        r = self.semi_major_elliptical * (1 - self.eccentricity_elliptical**2)/(1 + self.eccentricity_elliptical * np.cos(v))
+        # Solve Kepler's equation on the whole array at once
+        _, cosE = solve_kepler(M, e)
+        r = self.semi_major_elliptical * (1 - e * cosE)
         
         return r
     
     def orbital_position_circular(self, t):
-        """Calculate satellite position in circular orbit at time t."""
-        return self.radius_circular
+        """Calculate satellite position in circular orbit at time(s) t (scalar or array)."""
+        return np.full_like(np.asarray(t, dtype=float), self.radius_circular)
     
     def gravitational_potential(self, r):
         """Calculate gravitational potential at radius r."""
-        return -self.G * self.M / r
+        return -self._GM / r
     
     def frequency_shift(self, r):
         """Calculate fractional frequency shift due to gravitational redshift."""
-        Φ = self.gravitational_potential(r)
-        return Φ / self.c**2
+        return self.gravitational_potential(r) * self._inv_c2
     
     def simulate(self, duration_days=10, time_steps=1000):
         """
@@ -60,12 +96,12 @@ class GalileoRedshiftSimulation:
         times = np.linspace(0, duration_days*24*3600, time_steps)
         
         # Elliptical orbit
-        radii_elliptical = np.array([self.orbital_position_elliptical(t) for t in times])
-        shifts_elliptical = np.array([self.frequency_shift(r) for r in radii_elliptical])
+        radii_elliptical = self.orbital_position_elliptical(times)
+        shifts_elliptical = self.frequency_shift(radii_elliptical)
         
         # Circular orbit
-        radii_circular = np.array([self.orbital_position_circular(t) for t in times])
-        shifts_circular = np.array([self.frequency_shift(r) for r in radii_circular])
+        radii_circular = self.orbital_position_circular(times)
+        shifts_circular = self.frequency_shift(radii_circular)
         
         return times, radii_elliptical, shifts_elliptical, radii_circular, shifts_circular
 
@@ -76,10 +112,20 @@ class GalileoRedshiftSimulation:
       
         times_days = times / (24*3600)
         
+        # One preallocated block for the four plotted curves, filled in place with out=.
+        # Each curve gets its own row since matplotlib keeps a reference to the data it plots.
+        curves = np.empty((4, len(times)))
+        dr_elliptical, dr_circular, ppt_elliptical, ppt_circular = curves
+        np.subtract(radii_elliptical, np.mean(radii_elliptical), out=dr_elliptical)
+        dr_elliptical /= 1000
+        np.subtract(radii_circular, np.mean(radii_circular), out=dr_circular)
+        dr_circular /= 1000
+        np.multiply(shifts_elliptical, 1e12, out=ppt_elliptical)
+        np.multiply(shifts_circular, 1e12, out=ppt_circular)
        
-        ax1.plot(times_days, (radii_elliptical-np.mean(radii_elliptical))/1000, 'b-', 
+        ax1.plot(times_days, dr_elliptical, 'b-', 
                 label='Elliptical (Actual)')
-        ax1.plot(times_days, (radii_circular-np.mean(radii_circular))/1000, 'g--', 
+        ax1.plot(times_days, dr_circular, 'g--', 
                 label='Circular (Intended)')
         ax1.set_xlabel('Time (days)')
         ax1.set_ylabel('Radius variation (km)')
@@ -88,9 +134,9 @@ class GalileoRedshiftSimulation:
         ax1.legend()
         
         
-        ax2.plot(times_days, shifts_elliptical*1e12, 'r-', 
+        ax2.plot(times_days, ppt_elliptical, 'r-', 
                 label='Elliptical (Actual)')
-        ax2.plot(times_days, shifts_circular*1e12, 'm--', 
+        ax2.plot(times_days, ppt_circular, 'm--', 
                 label='Circular (Intended)')
         ax2.set_xlabel('Time (days)')
         ax2.set_ylabel('Frequency shift (parts per trillion)')
@@ -127,7 +173,7 @@ def main():
     print(f"Theoretical prediction: {theoretical_prediction:.2f} parts per trillion")
     print(f"Experimental uncertainty: ±{experimental_uncertainty:.2f} parts per trillion")
     
-    plt.show()
+    show_figure("galileo_redshift")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
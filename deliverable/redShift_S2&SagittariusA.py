@@ -1,11 +1,51 @@
+import os
+
 import numpy as np
+import matplotlib
+
+# The deliverable is shipped on its own, so its helpers are defined here
+# rather than imported from the repository root.
+
+# Set HEADLESS=1 (or true/yes) for batch runs: figures are then saved as
+# figure_<name>.png with the non-interactive Agg backend instead of shown.
+HEADLESS = os.environ.get("HEADLESS", "").strip().lower() not in ("", "0", "false", "no")
+if HEADLESS:
+    matplotlib.use("Agg")  # must happen before pyplot is imported
 import matplotlib.pyplot as plt
 
-# Constants (your constants are correct)
+def show_figure(name, block=True):
+    """Show the current figure, or in headless runs save it as figure_<name>.png and close it."""
+    if HEADLESS:
+        plt.savefig(f"figure_{name}.png", dpi=100)
+        plt.close()
+    else:
+        plt.show(block=block)
+
+def solve_kepler(M, e):
+    """
+    Solve Kepler's equation E - e sin(E) = M elementwise with Newton-Raphson.
+    Returns (sin E, cos E), reusing the last step's sine and cosine
+    corrected to first order in its tiny dE.
+    """
+    E = M + e * np.sin(M)
+    for _ in range(10):
+        sinE = np.sin(E)
+        cosE = np.cos(E)
+        dE = (E - e * sinE - M) / (1 - e * cosE)
+        E -= dE
+        if np.max(np.abs(dE)) < 1e-13:
+            break
+    return sinE - dE * cosE, cosE + dE * sinE
+
+# Constants (same values as physics_constants.py at the repository root)
 G = 6.67430e-11  # Gravitational constant (m^3 kg^-1 s^-2)
-c = 3.0e8        # Speed of light (m/s)
-M = 4.1e6 * 1.989e30  # Mass of Sgr A* (kg) (4.1 million solar masses)
+C = 299792458.0  # Speed of light (m/s)
+M_SGRA = 4.154e6 * 1.98847e30  # Mass of Sgr A* (kg) (4.154 million solar masses)
 AU = 1.496e11    # Astronomical Unit in meters
+GM_SGRA = G * M_SGRA
+INV_C2 = 1.0 / C**2
+
+r_s = 2 * GM_SGRA * INV_C2  # Schwarzschild radius 2GM/c^2 of Sgr A* (m), computed once
 
 # Orbital parameters for Star S2
 a = 120 * AU     # Semi-major axis (m), 120 AU
@@ -16,36 +56,30 @@ pericenter = a * (1 - e)  # Closest approach distance (m)
 # Time array
 time = np.linspace(0, T, 1000)  # Time points over one orbital period
 
-# Your orbit_position function is correct
 def orbit_position(a, e, T, t):
+    # t can be a scalar or a whole time array: everything below is elementwise
     n = 2 * np.pi / T
-    M = n * t
-    E = M
-    for _ in range(10):
-        E = M + e * np.sin(E)
-    theta = 2 * np.arctan2(np.sqrt(1 + e) * np.sin(E / 2), np.sqrt(1 - e) * np.cos(E / 2))
-    r = a * (1 - e**2) / (1 + e * np.cos(theta))
+    M = n * np.asarray(t, dtype=float)
+    sinE, cosE = solve_kepler(M, e)
+    theta = np.arctan2(np.sqrt(1 - e**2) * sinE, cosE - e)
+    r = a * (1 - e * cosE)
     return r, theta
 
 # Corrected gravitational redshift function
 def gravitational_redshift(r):
     # Complete formula: z = 1/sqrt(1 - 2GM/rc^2) - 1
-    return 1/np.sqrt(1 - 2 * G * M / (r * c**2)) - 1
+    return 1/np.sqrt(1 - r_s / r) - 1
 
 # Correcting the semi-major axis
 pericenter_desired = 120 * AU
 a_corrected = pericenter_desired / (1 - e)
 
-# Calculate positions and redshift
-r_values_corrected = []
-redshift_values_corrected = []
-for t in time:
-    r, _ = orbit_position(a_corrected, e, T, t)
-    r_values_corrected.append(r)
-    redshift_values_corrected.append(gravitational_redshift(r))
+# Calculate positions and redshift (vectorized over the whole time array)
+r_values_corrected, _ = orbit_position(a_corrected, e, T, time)
+redshift_values_corrected = gravitational_redshift(r_values_corrected)
 
 # Convert to AU for plotting
-r_values_corrected_au = np.array(r_values_corrected) / AU
+r_values_corrected_au = r_values_corrected / AU
 
 # Plotting
 plt.figure(figsize=(12, 6))
@@ -70,4 +104,4 @@ plt.legend()
 plt.grid()
 
 plt.tight_layout()
-plt.show()
+show_figure("S2_distance_redshift")
@@ -1,19 +1,11 @@
 import numpy as np
-import matplotlib.pyplot as plt
-from scipy.integrate import solve_ivp
+from figures import plt, show_figure
 
-# ---------------------------------------------------------
-# Constants
-# ---------------------------------------------------------
-G = 6.67430e-11           # gravitational constant (m^3 / kg / s^2)
-c = 299792458             # speed of light (m/s)
-M_earth = 5.97219e24      # mass of Earth (kg)
-R_earth = 6371000         # mean radius of Earth (m)
-
-# For the black hole at the Galactic center:
-# It's approximately 4.3e6 solar masses.
-M_sun = 1.98847e30
-M_SMBH = 4.3e6 * M_sun  # mass of the supermassive black hole at the center
+from physics_constants import (
+    G, INV_C2, M_EARTH, R_EARTH, AU,
+    M_SGRA,  # mass of the supermassive black hole at the Galactic center
+    GM_EARTH, GM_SGRA, solve_kepler,
+)
 
 # ---------------------------------------------------------
 # Gravitational potential
@@ -33,47 +25,53 @@ def freq_shift_ratio(r_em, r_obs, M):
     """
     phi_em = gravitational_potential(r_em, M)
     phi_obs = gravitational_potential(r_obs, M)
-    return (phi_em - phi_obs) / c**2
+    return (phi_em - phi_obs) * INV_C2
 
 # ---------------------------------------------------------
-# ODE for two-body (central force) in 2D plane
-#   y = [x, vx, y, vy]
-#   r = sqrt(x^2 + y^2)
-#   dv/dt = -GM / r^3 * r_vector
+# Two-body (central force) orbit in 2D plane, closed form
+#   Kepler's equation (solve_kepler): M = E - e sin(E), M = n (t - t_peri)
+#   distance from the central mass: r = a (1 - e cos E)
+# No numerical integration: distances are exact at every t.
 # ---------------------------------------------------------
-def kepler_eq(t, y, GM):
-    x, vx, y_, vy = y
-    r = np.sqrt(x**2 + y_**2)
-    ax = -GM * x / r**3
-    ay = -GM * y_ / r**3
-    return [vx, ax, vy, ay]
-
 def solve_orbit(r0, v0, M, t_span, steps=1000):
     """
-    Solve an orbit in the XY-plane.
+    Propagate an orbit in the XY-plane analytically and return (t, r),
+    the times and the distances from the central mass.
       r0  : initial radius (m)
       v0  : initial tangential velocity or velocity vector magnitude (m/s)
       M   : central mass
       t_span : (t0, t1) times
       steps : number of time steps
+    r0 and v0 may also be arrays of initial conditions (one per body):
+    r then has shape r0.shape + (steps,), all bodies solved in one pass.
+    Only bound (circular or elliptical) orbits are supported: the initial
+    conditions must satisfy v0**2 < 2 GM / r0 (below escape velocity),
+    otherwise a ValueError is raised.
     """
     GM = G * M
-    
-    # We'll assume a purely circular or elliptical initial condition:
-    #   position = (r0, 0), velocity = (0, v0) in XY-plane
-    #   for elliptical orbits, you might set v0 < circular velocity, etc.
-    y0 = [r0, 0.0, 0.0, v0]  # x, vx, y, vy
-    
-    t_eval = np.linspace(t_span[0], t_span[1], steps)
-    sol = solve_ivp(kepler_eq, t_span, y0, args=(GM,), t_eval=t_eval, rtol=1e-9, atol=1e-12)
-    
-    x_vals = sol.y[0]
-    vx_vals = sol.y[1]
-    y_vals = sol.y[2]
-    vy_vals = sol.y[3]
-    t_vals = sol.t
-    
-    return t_vals, x_vals, y_vals, vx_vals, vy_vals
+    # Orbital elements broadcast against the time axis
+    r0 = np.asarray(r0, dtype=float)[..., np.newaxis]
+    v0 = np.asarray(v0, dtype=float)[..., np.newaxis]
+    
+    # Initial condition: position = (r0, 0), velocity = (0, v0) in XY-plane
+    # Kepler's equation below only describes bound orbits (a > 0)
+    inv_a = 2 / r0 - v0**2 / GM
+    if np.any(inv_a <= 0):
+        raise ValueError("solve_orbit: unbound orbit (v0 >= escape velocity sqrt(2GM/r0)); "
+                         "only circular or elliptical orbits are supported")
+    
+    # The velocity is tangential, so the start point is an apsis:
+    #   v0 > circular velocity -> pericenter, v0 < circular velocity -> apocenter
+    a = 1 / inv_a
+    e = np.abs(1 - r0 / a)
+    n = np.sqrt(GM / a**3)  # mean motion, T = 2 pi / n
+    M0 = np.where(r0 <= a, 0.0, np.pi)
+    
+    t_vals = np.linspace(t_span[0], t_span[1], steps)
+    _, cosE = solve_kepler(M0 + n * (t_vals - t_span[0]), e)
+    r_vals = a * (1 - e * cosE)
+    
+    return t_vals, r_vals
 
 # ---------------------------------------------------------
 # 1. GALILEO SATELLITES: EXAMPLE SIMULATION
@@ -87,51 +85,51 @@ def simulate_galileo():
     by choosing r0 and v0 that don't match a perfect circular orbit.
     We'll compute a typical observation from Earth surface
     (r_obs = Earth's radius) up to orbit radius.
+    
+    Returns (t_vals, df_over_f) with df_over_f of shape (2, steps),
+    one row per satellite; see plot_galileo.
     """
     # Typical orbital data (roughly):
     # Let's say the final orbit is around 17000 km altitude (not correct, but for illustration).
     # Let's just pick a big "incorrect" elliptical orbit by setting a slightly smaller velocity
     # than circular velocity, so the orbit remains elliptical.
     
-    # Starting radius = R_earth + 17000e3 = 23710000 m
-    # We'll create two different orbits for the two satellites:
-    r0_sat1 = R_earth + 17000e3
-    r0_sat2 = R_earth + 16000e3  # slight difference
+    # Starting radius = R_EARTH + 17000e3 = 23710000 m
+    # We'll create two different orbits for the two satellites,
+    # stacked so that both are propagated together:
+    r0_sats = np.array([R_EARTH + 17000e3,   # satellite 1
+                        R_EARTH + 16000e3])  # satellite 2, slight difference
     
     # Circular velocity at r0 would be v_circ = sqrt(GM_earth / r0).
     # We reduce it a bit for elliptical orbit.
-    def v_circ(r): return np.sqrt(G*M_earth / r)
-    v0_sat1 = 0.95 * v_circ(r0_sat1)
-    v0_sat2 = 0.90 * v_circ(r0_sat2)
+    v_circ = np.sqrt(GM_EARTH / r0_sats)
+    v0_sats = np.array([0.95, 0.90]) * v_circ
     
     # Integrate for, say, 14 hours:
     t_end = 14 * 3600  # seconds
     t_span = (0, t_end)
     
-    # Solve orbits
-    t1, x1, y1, vx1, vy1 = solve_orbit(r0_sat1, v0_sat1, M_earth, t_span, steps=2000)
-    t2, x2, y2, vx2, vy2 = solve_orbit(r0_sat2, v0_sat2, M_earth, t_span, steps=2000)
-    
-    # Distances from Earth's center
-    r_sat1 = np.sqrt(x1**2 + y1**2)
-    r_sat2 = np.sqrt(x2**2 + y2**2)
+    # Solve both orbits in one call: distances from Earth's center, shape (2, steps)
+    t_vals, r_sats = solve_orbit(r0_sats, v0_sats, M_EARTH, t_span, steps=2000)
     
     # We measure the frequency shift between the satellite orbit and Earth’s surface
-    r_obs = R_earth  # assume receiving station on surface
+    r_obs = R_EARTH  # assume receiving station on surface
     
-    df_over_f_sat1 = freq_shift_ratio(r_sat1, r_obs, M_earth)
-    df_over_f_sat2 = freq_shift_ratio(r_sat2, r_obs, M_earth)
+    df_over_f = freq_shift_ratio(r_sats, r_obs, M_EARTH)
     
-    # Plot results
+    return t_vals, df_over_f
+
+def plot_galileo(t_vals, df_over_f):
+    """Plot the frequency shift of both Galileo satellites over time (one row of df_over_f each)."""
     plt.figure(figsize=(8,6))
-    plt.plot(t1/3600, df_over_f_sat1, label='Satellite 1')
-    plt.plot(t2/3600, df_over_f_sat2, label='Satellite 2')
+    for i, df_over_f_sat in enumerate(df_over_f, start=1):
+        plt.plot(t_vals/3600, df_over_f_sat, label=f'Satellite {i}')
     plt.xlabel('Time (hours)')
     plt.ylabel('Δf / f')
     plt.title('Gravitational Redshift - Two Galileo Satellites (Simplified)')
     plt.legend()
     plt.grid(True)
-    plt.show(block=False)
+    show_figure("galileo_satellites", block=False)
 
 # ---------------------------------------------------------
 # 2. STAR S2 AROUND SMBH
@@ -143,16 +141,17 @@ def simulate_star_S2():
     
     Real orbit is ~16 years period, highly elliptical (~0.88 eccentricity).
     We do a simplistic approach here just to illustrate frequency shift.
+    
+    Returns (t_vals, df_over_f_S2); see plot_star_S2.
     """
     # Roughly, the semi-major axis is ~1000 AU (very approximate).
     # 1 AU ~ 1.496e11 m
     # For a real elliptical orbit, we'd do a more advanced param setup.
     # Here let's do an approximate elliptical orbit by picking an initial distance ~1000 AU
     # and a velocity < circular velocity to mimic elliptical orbit.
-    AU = 1.496e11
     r0_S2 = 1000 * AU  # initial distance from SMBH center
     # Circular velocity at r0:
-    v_circ = np.sqrt(G * M_SMBH / r0_S2)
+    v_circ = np.sqrt(GM_SGRA / r0_S2)
     # Choose something to give elliptical orbit:
     v0_S2 = 0.7 * v_circ
     
@@ -163,31 +162,36 @@ def simulate_star_S2():
     
     # Solve orbit
     steps = 5000
-    t_vals, x_vals, y_vals, vx_vals, vy_vals = solve_orbit(r0_S2, v0_S2, M_SMBH, t_span, steps)
-    
-    r_S2 = np.sqrt(x_vals**2 + y_vals**2)
+    t_vals, r_S2 = solve_orbit(r0_S2, v0_S2, M_SGRA, t_span, steps)
     
     # Suppose the observer is "infinitely far away" for practical purposes,
     # i.e. r_obs -> ∞ => Phi(obs) ~ 0 in Newtonian sense
     # So the gravitational redshift ratio ~ Phi(r_em) / c^2
-    df_over_f_S2 = gravitational_potential(r_S2, M_SMBH) / c**2  # negative values
+    df_over_f_S2 = gravitational_potential(r_S2, M_SGRA) * INV_C2  # negative values
     
-    # Plot
+    return t_vals, df_over_f_S2
+
+def plot_star_S2(t_vals, df_over_f_S2):
+    """Plot the frequency shift of star S2 over one orbit."""
     plt.figure(figsize=(8,6))
     plt.plot(t_vals/(3600*24*365), df_over_f_S2)
     plt.xlabel('Time (years)')
     plt.ylabel('Δf / f')
     plt.title('Gravitational Redshift - Star S2 (Simplified Newtonian Orbit)')
     plt.grid(True)
-    plt.show(plt.show())
+    show_figure("star_S2")
 
 # ---------------------------------------------------------
 # MAIN DEMO
 # ---------------------------------------------------------
 if __name__ == "__main__":
+    # Run every simulation first, then draw: plotting never interleaves with the computation
     # 1) Galileo satellites
-    simulate_galileo()
+    galileo_results = simulate_galileo()
     
     # 2) Star S2
-    simulate_star_S2()
+    s2_results = simulate_star_S2()
+    
+    plot_galileo(*galileo_results)
+    plot_star_S2(*s2_results)
 
@@ -0,0 +1,28 @@
+import os
+import matplotlib
+
+# ---------------------------------------------------------
+# Figure output shared by all scripts:
+#   from figures import plt, show_figure
+# Set HEADLESS=1 (or true/yes) in the environment for batch runs: figures are then
+# drawn with the non-interactive Agg backend and saved as
+# figure_<name>.png instead of opening a window.
+# ---------------------------------------------------------
+HEADLESS = os.environ.get("HEADLESS", "").strip().lower() not in ("", "0", "false", "no")
+if HEADLESS:
+    matplotlib.use("Agg")  # must happen before pyplot is imported
+
+import matplotlib.pyplot as plt
+
+__all__ = ["plt", "show_figure", "HEADLESS"]
+
+def show_figure(name, block=True):
+    """
+    Show the current figure, or in headless runs save it as
+    figure_<name>.png and close it.
+    """
+    if HEADLESS:
+        plt.savefig(f"figure_{name}.png", dpi=100)
+        plt.close()
+    else:
+        plt.show(block=block)
@@ -0,0 +1,58 @@
+import numpy as np
+
+# ---------------------------------------------------------
+# Shared constants and formulas for every simulation script:
+#   from physics_constants import G, M_EARTH, ...
+# ---------------------------------------------------------
+__all__ = [
+    "G", "C", "C2", "INV_C2",
+    "M_SUN", "M_EARTH", "R_EARTH", "M_SGRA", "AU",
+    "GM_EARTH", "GM_SGRA",
+    "gravitational_redshift_inf", "orbit_radius",
+    "solve_kepler",
+]
+
+# Constants
+G = 6.67430e-11          # Gravitational constant, m^3 kg^-1 s^-2
+C = 299792458.0          # Speed of light, m/s
+C2 = C * C               # c^2, m^2/s^2
+INV_C2 = 1.0 / C2        # 1/c^2, s^2/m^2
+
+M_SUN = 1.98847e30       # Solar mass, kg
+M_EARTH = 5.9722e24      # Mass of Earth, kg
+R_EARTH = 6.371e6        # Mean radius of Earth, m
+M_SGRA = 4.154e6 * M_SUN  # Mass of Sagittarius A* (4.154 million solar masses), kg
+AU = 1.496e11            # Astronomical Unit, m
+
+GM_EARTH = G * M_EARTH   # m^3 s^-2
+GM_SGRA = G * M_SGRA     # m^3 s^-2
+
+# Gravitational redshift (Einstein effect) between radius r and an observer at infinity,
+# weak-field limit: z = GM / (r c^2)
+def gravitational_redshift_inf(r, GM):
+    return GM * INV_C2 / r
+
+# Orbit radius at true anomaly theta of an elliptical orbit (a, e):
+# r = a(1 - e^2) / (1 + e cos(theta))
+def orbit_radius(theta, a, e):
+    return a * (1.0 - e * e) / (1.0 + e * np.cos(theta))
+
+# ---------------------------------------------------------
+# Kepler's equation: M = E - e sin(E)
+# ---------------------------------------------------------
+def solve_kepler(M, e):
+    """
+    Solve Kepler's equation E - e sin(E) = M for the eccentric anomaly E,
+    elementwise over the array M, with Newton-Raphson.
+    Returns (sin E, cos E), which is all the orbits need: the sine and cosine
+    from the last Newton step are reused, corrected to first order in its tiny dE.
+    """
+    E = M + e * np.sin(M)
+    for _ in range(10):
+        sinE = np.sin(E)
+        cosE = np.cos(E)
+        dE = (E - e * sinE - M) / (1 - e * cosE)
+        E -= dE
+        if np.max(np.abs(dE)) < 1e-13:
+            break
+    return sinE - dE * cosE, cosE + dE * sinE
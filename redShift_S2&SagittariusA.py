@@ -1,11 +1,9 @@
 import numpy as np
-import matplotlib.pyplot as plt
+from figures import plt, show_figure
 
-# Constants (your constants are correct)
-G = 6.67430e-11  # Gravitational constant (m^3 kg^-1 s^-2)
-c = 3.0e8        # Speed of light (m/s)
-M = 4.1e6 * 1.989e30  # Mass of Sgr A* (kg) (4.1 million solar masses)
-AU = 1.496e11    # Astronomical Unit in meters
+from physics_constants import GM_SGRA, INV_C2, AU, solve_kepler
+
+r_s = 2 * GM_SGRA * INV_C2  # Schwarzschild radius 2GM/c^2 of Sgr A* (m), computed once
 
 # Orbital parameters for Star S2
 a = 120 * AU     # Semi-major axis (m), 120 AU
@@ -16,36 +14,30 @@ pericenter = a * (1 - e)  # Closest approach distance (m)
 # Time array
 time = np.linspace(0, T, 1000)  # Time points over one orbital period
 
-# Your orbit_position function is correct
 def orbit_position(a, e, T, t):
+    # t can be a scalar or a whole time array: everything below is elementwise
     n = 2 * np.pi / T
-    M = n * t
-    E = M
-    for _ in range(10):
-        E = M + e * np.sin(E)
-    theta = 2 * np.arctan2(np.sqrt(1 + e) * np.sin(E / 2), np.sqrt(1 - e) * np.cos(E / 2))
-    r = a * (1 - e**2) / (1 + e * np.cos(theta))
+    M = n * np.asarray(t, dtype=float)
+    sinE, cosE = solve_kepler(M, e)
+    theta = np.arctan2(np.sqrt(1 - e**2) * sinE, cosE - e)
+    r = a * (1 - e * cosE)
     return r, theta
 
 # Corrected gravitational redshift function
 def gravitational_redshift(r):
     # Complete formula: z = 1/sqrt(1 - 2GM/rc^2) - 1
-    return 1/np.sqrt(1 - 2 * G * M / (r * c**2)) - 1
+    return 1/np.sqrt(1 - r_s / r) - 1
 
 # Correcting the semi-major axis
 pericenter_desired = 120 * AU
 a_corrected = pericenter_desired / (1 - e)
 
-# Calculate positions and redshift
-r_values_corrected = []
-redshift_values_corrected = []
-for t in time:
-    r, _ = orbit_position(a_corrected, e, T, t)
-    r_values_corrected.append(r)
-    redshift_values_corrected.append(gravitational_redshift(r))
+# Calculate positions and redshift (vectorized over the whole time array)
+r_values_corrected, _ = orbit_position(a_corrected, e, T, time)
+redshift_values_corrected = gravitational_redshift(r_values_corrected)
 
 # Convert to AU for plotting
-r_values_corrected_au = np.array(r_values_corrected) / AU
+r_values_corrected_au = r_values_corrected / AU
 
 # Plotting
 plt.figure(figsize=(12, 6))
@@ -70,4 +62,4 @@ plt.legend()
 plt.grid()
 
 plt.tight_layout()
-plt.show()
+show_figure("S2_distance_redshift")